@@ -22,10 +22,11 @@ to do.
 """
 
 # Standard
-from contextlib import contextmanager
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Type, Union
 
 # Third Party
+import numpy as np
 import pandas as pd
 
 # this import is ok because this module is NOT proactively imported
@@ -39,8 +40,13 @@ from .....core.data_model import ProducerId
 from .....core.exceptions import error_handler
 from .._single_timeseries import SingleTimeSeries
 from .base import MultiTimeSeriesBackendBase, TimeSeriesBackendBase
-from .pandas_backends import PandasMultiTimeSeriesBackend, PandasTimeSeriesBackend
-from .spark_util import mock_pd_groupby
+from .dfcache import ensure_spark_cached
+from .pandas_backends import (
+    PandasTimeSeriesBackend,
+    _validate_mts_params,
+    _validate_ts_params,
+)
+from .spark_util import arrow_to_pandas, mock_pd_groupby
 
 if TYPE_CHECKING:
     # Local
@@ -50,32 +56,13 @@ log = alog.use_channel("SPBCK")
 error = error_handler.get(log)
 
 
-@contextmanager
-def ensure_spark_cached(dataframe: pyspark.sql.DataFrame) -> pyspark.sql.DataFrame:
-    """Will ensure that a given dataframe is cached.
-    If dataframe is already cached it does nothing. If it's not
-    cached, it will cache it and then uncache the object when
-    the ensure_spark_cached object container goes out of scope. Users
-    must utilize the with pattern of access.
-
-    Example:
-    ```python
-        with ensure_spark_cached(df) as _:
-            # do dataframey sorts of things on df
-            # it's guarenteed to be cached
-            # inside this block
-        # that's it, you're done.
-        # df remains cached if it already was
-        # or it's no longer cached if it wasn't
-        # before entering the with block above.
-    ```
+def _python_key(value: Any) -> Any:
+    """Converts a pandas groupby key to the python value that a spark Row
+    holds for it (None for nulls, python scalars for numpy scalars)
     """
-    do_cache = hasattr(dataframe, "cache") and not dataframe.is_cached
-    if do_cache:
-        dataframe.cache()
-    yield dataframe
-    if do_cache:
-        dataframe.unpersist()
+    if pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
 
 
 class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
@@ -87,12 +74,38 @@ class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
         value_columns: Optional[Iterable[str]] = None,
         ids: Optional[Union[Iterable[int], Iterable[str]]] = None,
         producer_id: Optional[Union[Tuple[str, str], ProducerId]] = None,
+        lazy_timeseries: bool = False,
     ):
+        """At init time, hold onto the data frame as well as the arguments that
+        tell where the keys, time and values live
+
+        Args:
+            data_frame:  pyspark.sql.DataFrame
+                The raw data frame
+            key_column:  Union[Iterable[str], str]
+                The name(s) of the column(s) holding the timeseries ids
+            timestamp_column:  Optional[str]
+                The name of the column holding the timestamps
+            value_columns:  Optional[Iterable[str]]
+                A sequence of names of columns to hold as values
+            ids:  Optional[Union[Iterable[int], Iterable[str]]]
+                A sequence of IDs associated with this TimeSeries
+            producer_id:  Optional[Union[Tuple[str, str], ProducerId]]
+                The producer of this TimeSeries
+            lazy_timeseries:  bool
+                If False (the default), the timeseries attribute of a keyed
+                TimeSeries is built by collecting the data frame once and
+                splitting it into pandas backed timeseries. If True, each
+                timeseries is backed by its own filtered (lazy) spark data
+                frame, which keeps the data distributed at the cost of one
+                spark job per timeseries. Those jobs are cheapest against a
+                data frame grouped with dfcache.ensure_spark_grouped.
+        """
         error.type_check("<COR77829913E>", pyspark.sql.DataFrame, data_frame=data_frame)
+        error.type_check("<COR77829914E>", bool, lazy_timeseries=lazy_timeseries)
 
-        # for param validation
-        pd_mts = PandasMultiTimeSeriesBackend(
-            data_frame=pd.DataFrame(columns=data_frame.columns),
+        _validate_mts_params(
+            columns=data_frame.columns,
             key_column=key_column,
             timestamp_column=timestamp_column,
             value_columns=value_columns,
@@ -101,15 +114,17 @@ class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
         )
 
         self._pyspark_df: pyspark.sql.DataFrame = data_frame
-        # for tapping into pandas api call when needed
-        self._pyspark_pandas_df = self._pyspark_df.pandas_api()
         self._key_column = key_column
+        self._key_columns = [key_column] if isinstance(key_column, str) else key_column
         self._timestamp_column = timestamp_column
+        # a set of the key names rather than key_column itself, whose "in" is a
+        # substring check when it is a single str
+        key_set = set(self._key_columns)
         # pylint: disable=duplicate-code
         self._value_columns = value_columns or [
             col
             for col in data_frame.columns
-            if col != timestamp_column and col not in key_column
+            if col != timestamp_column and col not in key_set
         ]
         self._ids = [] if ids is None else ids
         self._producer_id = (
@@ -117,7 +132,17 @@ class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
             if isinstance(producer_id, ProducerId)
             else (ProducerId(*producer_id) if producer_id is not None else None)
         )
-        self._key_columns = pd_mts._key_columns
+        self._lazy_timeseries = lazy_timeseries
+        # row count is computed on first use of __len__
+        self._cached_count = None
+
+    def __len__(self) -> int:
+        """Return the number of rows in the underlying data frame. The count
+        is a full spark job so it is only computed once per backend.
+        """
+        if self._cached_count is None:
+            self._cached_count = self._pyspark_df.count()
+        return self._cached_count
 
     def get_attribute(self, data_model_class: Type["TimeSeries"], name: str) -> Any:
         if name == "timeseries":
@@ -131,7 +156,35 @@ class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
                         value_columns=self._value_columns,
                     )
                     result.append(SingleTimeSeries(_backend=backend))
+            elif not self._lazy_timeseries:
+                # a single collection of the whole frame followed by a native
+                # pandas groupby instead of one spark job per timeseries. Null
+                # keys form their own group (with None ids) as they do with
+                # the null safe filters of the lazy path.
+                for ids, pandas_df in arrow_to_pandas(self._pyspark_df).groupby(
+                    self._key_columns
+                    if len(self._key_columns) > 1
+                    else self._key_columns[0],
+                    dropna=False,
+                ):
+                    k = (
+                        tuple(_python_key(v) for v in ids)
+                        if isinstance(ids, tuple)
+                        else _python_key(ids)
+                    )
+                    if isinstance(k, (str, int)):
+                        k = [k]
+                    backend = PandasTimeSeriesBackend(
+                        pandas_df,
+                        timestamp_column=self._timestamp_column,
+                        value_columns=self._value_columns,
+                        ids=k,
+                    )
+                    result.append(SingleTimeSeries(_backend=backend))
             else:
+                # NOTE: the per group filters are lazy and the backends defer
+                #   all spark work to attribute access, so this loop submits
+                #   no spark jobs and gains nothing from running in parallel
                 with ensure_spark_cached(self._pyspark_df) as _:
                     for ids, spark_df in mock_pd_groupby(
                         self._pyspark_df, by=self._key_columns
@@ -159,7 +212,7 @@ class SparkMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
 
     def as_pandas(self) -> Tuple[pd.DataFrame, Iterable[str], str, Iterable[str]]:
         return (
-            self._pyspark_df.toPandas(),
+            arrow_to_pandas(self._pyspark_df),
             self._key_column,
             self._timestamp_column,
             self._value_columns,
@@ -198,18 +251,42 @@ class SparkTimeSeriesBackend(TimeSeriesBackendBase):
 
         self._pyspark_df: pyspark.sql.DataFrame = data_frame
 
-        # for tapping into pandas api call when needed
-        self._pyspark_pandas_df = self._pyspark_df.pandas_api()
-
-        # this will give us basic parameter validation
-        self._pdbackend_helper = PandasTimeSeriesBackend(
-            data_frame=pd.DataFrame(columns=data_frame.columns),
+        self._timestamp_column = (
+            str(timestamp_column) if timestamp_column is not None else timestamp_column
+        )
+        self._value_columns = _validate_ts_params(
+            columns=data_frame.columns,
+            timestamp_column=self._timestamp_column,
             value_columns=value_columns,
-            timestamp_column=str(timestamp_column)
-            if timestamp_column is not None
-            else timestamp_column,
             ids=ids,
         )
+        self._ids = ids
+
+    @cached_property
+    def _pdbackend_helper(self) -> PandasTimeSeriesBackend:
+        """The pandas backend whose attribute logic is reused (against the
+        pandas api view of the spark data frame) by get_attribute. The fields
+        were validated at init so no placeholder data frame is needed.
+        """
+        return PandasTimeSeriesBackend._for_external_df(
+            timestamp_column=self._timestamp_column,
+            value_columns=self._value_columns,
+            ids=self._ids,
+        )
+
+    @cached_property
+    def _pyspark_pandas_df(self) -> "pyspark.pandas.DataFrame":
+        """For tapping into pandas api call when needed. This is deferred
+        until first use since attaching the default index can require a
+        scan of the data frame. The distributed index type avoids the global
+        row numbering that the default (sequence) index types need.
+        """
+        # Third Party
+        # pylint: disable=import-outside-toplevel
+        import pyspark.pandas as ps
+
+        with ps.option_context("compute.default_index_type", "distributed"):
+            return self._pyspark_df.pandas_api()
 
     def get_attribute(
         self, data_model_class: Type["SingleTimeSeries"], name: str
@@ -227,7 +304,7 @@ class SparkTimeSeriesBackend(TimeSeriesBackendBase):
 
     def as_pandas(self) -> Tuple[pd.DataFrame, str, Iterable[str]]:
         return (
-            self._pyspark_df.toPandas(),
-            self._pdbackend_helper._timestamp_column,
-            self._pdbackend_helper._value_columns,
+            arrow_to_pandas(self._pyspark_df),
+            self._timestamp_column,
+            self._value_columns,
         )
@@ -15,19 +15,26 @@
 
 # Standard
 from contextlib import contextmanager
+from typing import List
 
 # Third Party
+from pyspark import StorageLevel
 from pyspark.sql import DataFrame
 
 
 @contextmanager
-def ensure_spark_cached(dataframe: DataFrame) -> DataFrame:
+def ensure_spark_cached(dataframe: DataFrame, materialize: bool = False) -> DataFrame:
     """Will ensure that a given dataframe is cached.
     If dataframe is already cached it does nothing. If it's not
     cached, it will cache it and then uncache the object when
     the ensure_spark_cached object container goes out of scope. Users
     must utilize the with pattern of access.
 
+    Caching is lazy, so by default the first action inside the block fills
+    the cache as it scans. Pass materialize=True to fill it up front with a
+    count(), which only pays off when the block runs several actions against
+    the dataframe.
+
     Example:
     ```python
         with ensure_spark_cached(df) as _:
@@ -40,9 +47,40 @@ def ensure_spark_cached(dataframe: DataFrame) -> DataFrame:
         # before entering the with block above.
     ```
     """
-    do_cache = hasattr(dataframe, "cache") and not dataframe.is_cached
-    if do_cache:
-        dataframe.cache()
-    yield dataframe
+    do_cache = hasattr(dataframe, "persist") and not dataframe.is_cached
     if do_cache:
-        dataframe.unpersist()
+        # MEMORY_AND_DISK (serialized) is the appropriate level for pyspark
+        # dataframes
+        dataframe.persist(StorageLevel.MEMORY_AND_DISK)
+        if materialize:
+            dataframe.count()
+    try:
+        yield dataframe
+    finally:
+        if do_cache:
+            dataframe.unpersist()
+
+
+@contextmanager
+def ensure_spark_grouped(dataframe: DataFrame, by: List[str]) -> DataFrame:
+    """Will hash partition the given dataframe on the by columns, sort each
+    partition on them and then cache (see ensure_spark_cached) the result for
+    the duration of the with block. Every row of a given key then lives in a
+    single contiguous run of a single partition, so per key filters against
+    the yielded dataframe can skip most of the cached column batches instead
+    of scanning everything. Note that unlike ensure_spark_cached, the yielded
+    object is a new dataframe and not the one passed in.
+
+    Example:
+    ```python
+        with ensure_spark_grouped(df, ["key"]) as grouped_df:
+            mts = TimeSeries(grouped_df, key_column="key", lazy_timeseries=True)
+            # consume mts.timeseries inside this block
+    ```
+    """
+    if by:
+        dataframe = dataframe.repartition(*by).sortWithinPartitions(*by)
+    # the caller runs one filter per key against the grouped frame, so the
+    # cache is filled once up front
+    with ensure_spark_cached(dataframe, materialize=True) as grouped:
+        yield grouped
@@ -17,7 +17,7 @@ Core data model backends backed by pandas
 
 # Standard
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Type, Union
 import json
 
 # Third Party
@@ -41,7 +41,7 @@ from .base import (
     UncachedBackendMixin,
 )
 from .spark_util import iteritems_workaround
-from .util import pd_timestamp_to_seconds
+from .util import pd_timestamp_to_seconds, pd_timestamp_to_seconds_array
 
 if TYPE_CHECKING:
     # Local
@@ -51,6 +51,108 @@ log = alog.use_channel("PDBCK")
 error = error_handler.get(log)
 
 
+def _validate_mts_params(
+    columns: Iterable[str],
+    key_column: Union[Iterable[str], str],
+    timestamp_column: Optional[str] = None,
+    value_columns: Optional[Iterable[str]] = None,
+    ids: Optional[Union[Iterable[int], Iterable[str]]] = None,
+    producer_id: Optional[Union[Tuple[str, str], ProducerId]] = None,
+):
+    """Validates the arguments of a multi timeseries backend against the
+    column names of its data frame. This only needs the column names so
+    backends that are not backed by pandas can share it without building a
+    placeholder pandas.DataFrame.
+    """
+    error.type_check(
+        "<COR81128391E>",
+        list,
+        str,
+        key_column=key_column,
+    )
+    error.type_check(
+        "<COR81128392E>", str, int, type(None), timestamp_column=timestamp_column
+    )
+    error.type_check_all(
+        "<COR81128393E>",
+        str,
+        int,
+        allow_none=True,
+        value_columns=value_columns,
+    )
+    error.type_check_all(
+        "<COR81128394E>",
+        str,
+        allow_none=True,
+        ids=ids,
+    )
+    error.type_check(
+        "<COR81128395E>",
+        tuple,
+        ProducerId,
+        allow_none=True,
+        producer_id=producer_id,
+    )
+
+    # Validate the column names
+    error.value_check(
+        "<COR04942296E>",
+        (timestamp_column is None or (timestamp_column in columns)),
+        "Invalid timestamp column/index: {}",
+        timestamp_column,
+    )
+
+
+def _validate_ts_params(
+    columns: Iterable[str],
+    timestamp_column: Optional[str] = None,
+    value_columns: Optional[Iterable[str]] = None,
+    ids: Optional[Union[Iterable[int], Iterable[str]]] = None,
+) -> List[str]:
+    """Validates the arguments of a single timeseries backend against the
+    column names of its data frame.
+
+    Returns:
+        value_columns:  List[str]
+            The value columns, defaulting to every non-timestamp column
+    """
+    error.type_check(
+        "<COR81128381E>", str, type(None), timestamp_column=timestamp_column
+    )
+    error.type_check_all(
+        "<COR81128382E>",
+        str,
+        allow_none=True,
+        value_columns=value_columns,
+    )
+    error.type_check_all(
+        "<COR81128383E>",
+        str,
+        np.int_,
+        int,
+        allow_none=True,
+        ids=ids,
+    )
+
+    # Validate the column names
+
+    error.value_check(
+        "<COR81128385E>",
+        (timestamp_column is None or (timestamp_column in columns)),
+        "Invalid timestamp column/index: {}",
+        timestamp_column,
+    )
+    value_columns = value_columns or [col for col in columns if col != timestamp_column]
+    error.value_check(
+        "<COR89526927E>",
+        # TODO: Support lambdas!
+        all(value_col in columns for value_col in value_columns),
+        "Invalid value columns: {}",
+        value_columns,
+    )
+    return value_columns
+
+
 class PandasMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
     def as_pandas(self) -> Tuple[pd.DataFrame, Iterable[str], str, Iterable[str]]:
         return self._df, self._key_column, self._timestamp_column, self._value_columns
@@ -65,44 +167,15 @@ class PandasMultiTimeSeriesBackend(MultiTimeSeriesBackendBase):
         producer_id: Optional[Union[Tuple[str, str], ProducerId]] = None,
     ):
         error.type_check("<COR81128390E>", pd.DataFrame, data_frame=data_frame)
-        error.type_check(
-            "<COR81128391E>",
-            list,
-            str,
+        _validate_mts_params(
+            columns=data_frame.columns,
             key_column=key_column,
-        )
-        error.type_check(
-            "<COR81128392E>", str, int, type(None), timestamp_column=timestamp_column
-        )
-        error.type_check_all(
-            "<COR81128393E>",
-            str,
-            int,
-            allow_none=True,
+            timestamp_column=timestamp_column,
             value_columns=value_columns,
-        )
-        error.type_check_all(
-            "<COR81128394E>",
-            str,
-            allow_none=True,
             ids=ids,
-        )
-        error.type_check(
-            "<COR81128395E>",
-            tuple,
-            ProducerId,
-            allow_none=True,
             producer_id=producer_id,
         )
 
-        # Validate the column names
-        error.value_check(
-            "<COR04942296E>",
-            (timestamp_column is None or (timestamp_column in data_frame.columns)),
-            "Invalid timestamp column/index: {}",
-            timestamp_column,
-        )
-
         self._df = data_frame
         self._key_column = key_column
         self._timestamp_column = timestamp_column
@@ -194,48 +267,37 @@ class PandasTimeSeriesBackend(TimeSeriesBackendBase):
         """
         # Validate the types and column names
         error.type_check("<COR81128380E>", pd.DataFrame, data_frame=data_frame)
-        error.type_check(
-            "<COR81128381E>", str, type(None), timestamp_column=timestamp_column
-        )
-        error.type_check_all(
-            "<COR81128382E>",
-            str,
-            allow_none=True,
+        value_columns = _validate_ts_params(
+            columns=data_frame.columns,
+            timestamp_column=timestamp_column,
             value_columns=value_columns,
-        )
-        error.type_check_all(
-            "<COR81128383E>",
-            str,
-            np.int_,
-            int,
-            allow_none=True,
             ids=ids,
         )
 
-        # Validate the column names
-
-        error.value_check(
-            "<COR81128385E>",
-            (timestamp_column is None or (timestamp_column in data_frame.columns)),
-            "Invalid timestamp column/index: {}",
-            timestamp_column,
-        )
-        value_columns = value_columns or [
-            col for col in data_frame.columns if col != timestamp_column
-        ]
-        error.value_check(
-            "<COR89526927E>",
-            # TODO: Support lambdas!
-            all(value_col in data_frame.columns for value_col in value_columns),
-            "Invalid value columns: {}",
-            value_columns,
-        )
-
         self._df = data_frame
         self._timestamp_column = timestamp_column
         self._value_columns = value_columns
         self._ids = [] if ids is None else ids
 
+    @classmethod
+    def _for_external_df(
+        cls,
+        timestamp_column: Optional[str],
+        value_columns: List[str],
+        ids: Optional[Union[Iterable[int], Iterable[str]]] = None,
+    ) -> "PandasTimeSeriesBackend":
+        """Builds a backend that holds no data frame of its own, for callers
+        (such as the spark backend) that have already validated these
+        arguments with _validate_ts_params and always pass external_df to
+        get_attribute
+        """
+        backend = cls.__new__(cls)
+        backend._df = None
+        backend._timestamp_column = timestamp_column
+        backend._value_columns = value_columns
+        backend._ids = [] if ids is None else ids
+        return backend
+
     # pylint: disable=too-many-return-statements
     def get_attribute(
         self,
@@ -470,6 +532,18 @@ class PandasPointTimeSequenceBackend(
     ) -> Any:
         """Get the known attributes from the backend data"""
         if name == "points":
+            # datetime-like sequences are converted to epoch seconds in a single
+            # vectorized pass rather than one backend dispatch per point
+            if isinstance(self._time_sequence, pd.Series) and (
+                pd.api.types.is_datetime64_any_dtype(self._time_sequence)
+                or isinstance(self._time_sequence.dtype, pd.PeriodDtype)
+            ):
+                return [
+                    time_types.TimePoint(ts_epoch=time_types.Seconds(seconds=seconds))
+                    for seconds in pd_timestamp_to_seconds_array(
+                        self._time_sequence
+                    ).tolist()
+                ]
             # TODO: a user may have ints/floats stored as objects in their dataframe, should we
             # handle that or throw an exception
             return [
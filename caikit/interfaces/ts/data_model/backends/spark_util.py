@@ -14,7 +14,12 @@
 """Internal utilities for supporting spark backend implementations"""
 
 # Standard
-from typing import Any, Iterable, List
+from contextlib import contextmanager
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import operator
+import threading
+import warnings
 
 # Third Party
 import pandas as pd
@@ -22,14 +27,104 @@ import pandas as pd
 # Local
 from ..toolkit.optional_dependencies import HAVE_PYSPARK, pyspark
 
+# spark configuration keys that route toPandas() through arrow record batches
+_ARROW_CONF_KEYS = (
+    "spark.sql.execution.arrow.pyspark.enabled",
+    "spark.sql.execution.arrow.pyspark.fallback.enabled",
+)
+
+
+# the configuration is shared by every thread using a session, so overlapping
+# arrow_enabled blocks are counted per session: the first to enter saves the
+# prior values and the last to exit restores them
+_ARROW_CONF_LOCK = threading.Lock()
+_ARROW_CONF_USERS: Dict[int, Tuple[int, Dict[str, Optional[str]]]] = {}
+
+
+@contextmanager
+def arrow_enabled(spark_session: "pyspark.sql.SparkSession"):
+    """Temporarily enables arrow based columnar transfers (with fallback to
+    the non-arrow path for unsupported types) on the given spark session.
+    The prior session configuration is restored once the last overlapping
+    arrow_enabled block (from any thread) on that session exits.
+
+    NOTE: the change is session wide, so other work on the session that runs
+    while a block is open also sees arrow enabled.
+
+    Since arrow is forced here rather than chosen by the caller, the warning
+    spark emits when it falls back (e.g. for a VectorUDT column) is silenced.
+
+    NOTE: the size of each transferred batch can be tuned on the session with
+    spark.sql.execution.arrow.maxRecordsPerBatch
+    """
+    conf = spark_session.conf
+    session_id = id(spark_session)
+    with _ARROW_CONF_LOCK:
+        users, previous = _ARROW_CONF_USERS.get(session_id, (0, None))
+        if users == 0:
+            previous = {key: conf.get(key, None) for key in _ARROW_CONF_KEYS}
+            for key in _ARROW_CONF_KEYS:
+                conf.set(key, "true")
+        _ARROW_CONF_USERS[session_id] = (users + 1, previous)
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", "toPandas attempted Arrow optimization", UserWarning
+            )
+            yield spark_session
+    finally:
+        with _ARROW_CONF_LOCK:
+            users, previous = _ARROW_CONF_USERS.pop(session_id)
+            if users > 1:
+                _ARROW_CONF_USERS[session_id] = (users - 1, previous)
+            else:
+                for key, value in previous.items():
+                    if value is None:
+                        conf.unset(key)
+                    else:
+                        conf.set(key, value)
+
+
+def _has_user_defined_type(data_type: "pyspark.sql.types.DataType") -> bool:
+    """Whether a spark type is, or nests, a UserDefinedType (such as
+    pyspark.ml.linalg.VectorUDT) which arrow can not transfer
+    """
+    types = pyspark.sql.types
+    if isinstance(data_type, types.UserDefinedType):
+        return True
+    if isinstance(data_type, types.StructType):
+        return any(_has_user_defined_type(field.dataType) for field in data_type)
+    if isinstance(data_type, types.ArrayType):
+        return _has_user_defined_type(data_type.elementType)
+    if isinstance(data_type, types.MapType):
+        return _has_user_defined_type(data_type.keyType) or _has_user_defined_type(
+            data_type.valueType
+        )
+    return False
+
+
+def arrow_to_pandas(a_df: "pyspark.sql.DataFrame") -> pd.DataFrame:
+    """Collects a pyspark.sql.DataFrame to a native pandas.DataFrame using
+    arrow record batches rather than row-at-a-time serialization.
+
+    Schemas that arrow can not transfer are collected with the session as
+    configured by the caller since forcing arrow would only warn and fall
+    back to the non-arrow path.
+    """
+    if _has_user_defined_type(a_df.schema):
+        return a_df.toPandas()
+    with arrow_enabled(a_df.sparkSession):
+        return a_df.toPandas()
+
 
 def iteritems_workaround(series: Any, force_list: bool = False) -> Iterable:
     """pyspark.pandas.Series objects do not support
     iteration. For native pandas.Series objects this
     function will be a no-op.
 
-    For pyspark.pandas.Series or other iterable objects
-    we try to_numpy() (unless force_list
+    pyspark.pandas.Series objects are collected to a native
+    pandas.Series (using arrow) and handled as such. For other
+    iterable objects we try to_numpy() (unless force_list
     is true) and if that fails we resort to a to_list()
 
     """
@@ -40,16 +135,31 @@ def iteritems_workaround(series: Any, force_list: bool = False) -> Iterable:
             f"invalid typed {type(series)} passed for parameter series"
         )
 
-    if isinstance(series, pd.Series):
-        return series
-
-    # handle an edge case of pyspark.ml.linalg.DenseVector
+    # a single columnar transfer rather than to_numpy()/to_list() which
+    # serialize row-at-a-time. Collecting is the intent here so the advice
+    # warning about loading data into the driver is silenced.
     if (
         HAVE_PYSPARK
+        and not isinstance(series, pd.Series)
         and isinstance(series, pyspark.pandas.series.Series)
-        and isinstance(series[0], pyspark.ml.linalg.Vector)
     ):
-        return [x.toArray().tolist() for x in series.to_numpy()]
+        spark_session = pyspark.sql.SparkSession.builder.getOrCreate()
+        with arrow_enabled(spark_session), warnings.catch_warnings():
+            warnings.simplefilter(
+                "ignore", pyspark.pandas.utils.PandasAPIOnSparkAdviceWarning
+            )
+            series = series.to_pandas()
+
+    if isinstance(series, pd.Series):
+        # handle an edge case of pyspark.ml.linalg.DenseVector
+        if (
+            HAVE_PYSPARK
+            and series.dtype == object
+            and not series.empty
+            and isinstance(series.iloc[0], pyspark.ml.linalg.Vector)
+        ):
+            return [x.toArray().tolist() for x in series]
+        return series
 
     # note that we're forcing a list only if we're not
     # a native pandas series
@@ -63,17 +173,40 @@ def iteritems_workaround(series: Any, force_list: bool = False) -> Iterable:
 
 
 def mock_pd_groupby(a_df_like, by: List[str], return_pandas_api=False):
-    """Roughly mocks the behavior of pandas groupBy but on a spark dataframe."""
+    """Roughly mocks the behavior of pandas groupBy but on a spark dataframe.
+
+    The distinct keys are collected with a single job and each group is then
+    selected with a typed column predicate (rather than a formatted sql
+    string) so that non-string key values compare correctly and the filter
+    remains eligible for predicate pushdown.
+
+    NOTE: Joining against a broadcast of the distinct keys does not reduce
+        the work here since the keys come from a_df_like itself (the join
+        keeps every row). Callers that need every group on the driver should
+        collect once and group in pandas instead of iterating this generator.
+    """
 
     distinct_keys = a_df_like.select(by).distinct().collect()
+    if len(by) == 1:
+        # the common single key case needs neither the row dicts nor the
+        # conjunction of predicates
+        key_col = pyspark.sql.functions.col(by[0])
+        for (value,) in distinct_keys:
+            sub_df = a_df_like.filter(
+                key_col.eqNullSafe(pyspark.sql.functions.lit(value))
+            )
+            yield value, sub_df.pandas_api() if return_pandas_api else sub_df
+        return
+
     for dkey in distinct_keys:
         adict = dkey.asDict()
-        filter_statement = ""
-        for k, v in adict.items():
-            filter_statement += f" {k} == '{v}' and"
-        if filter_statement.endswith("and"):
-            filter_statement = filter_statement[0:-3]
-        sub_df = a_df_like.filter(filter_statement)
+        predicate = reduce(
+            operator.and_,
+            [
+                pyspark.sql.functions.col(k).eqNullSafe(pyspark.sql.functions.lit(v))
+                for k, v in adict.items()
+            ],
+        )
+        sub_df = a_df_like.filter(predicate)
         value = tuple(adict.values())
-        value = value[0] if len(value) == 1 else value
         yield value, sub_df.pandas_api() if return_pandas_api else sub_df
@@ -14,7 +14,8 @@
 """Internal utilities for supporting backend implementations"""
 
 # Standard
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Union
 
 # Third Party
@@ -22,6 +23,16 @@ import numpy as np
 import pandas as pd
 
 
+@lru_cache(maxsize=4096)
+def _local_offset_at(year: int, month: int, day: int, hour: int, minute: int) -> float:
+    """Returns the local system's utc offset (in seconds) at the start of the
+    given (naive) wall clock minute. Timezone transitions happen on whole
+    minutes, so this holds for every time within that minute.
+    """
+    wall_time = datetime(year=year, month=month, day=day, hour=hour, minute=minute)
+    return wall_time.replace(tzinfo=timezone.utc).timestamp() - wall_time.timestamp()
+
+
 def timezoneoffset(adatetime: datetime) -> int:
     """Returns the timezone offset (in seconds)
     for a given datetime object relative to the local
@@ -33,17 +44,19 @@ def timezoneoffset(adatetime: datetime) -> int:
     Returns:
         int: offset in seconds (can be negative)
     """
+    utcoffset = adatetime.utcoffset()
+    if utcoffset is None:
+        # naive datetimes are already in local time
+        return 0.0
     return (
-        adatetime.timestamp()
-        - datetime(
-            year=adatetime.year,
-            month=adatetime.month,
-            day=adatetime.day,
-            hour=adatetime.hour,
-            minute=adatetime.minute,
-            second=adatetime.second,
-            microsecond=adatetime.microsecond,
-        ).timestamp()
+        _local_offset_at(
+            adatetime.year,
+            adatetime.month,
+            adatetime.day,
+            adatetime.hour,
+            adatetime.minute,
+        )
+        - utcoffset.total_seconds()
     )
 
 
@@ -66,6 +79,35 @@ def pd_timestamp_to_seconds(ts) -> float:
     raise ValueError(f"invalid type {type(ts)} for parameter ts.")
 
 
+def pd_timestamp_to_seconds_array(timestamps) -> np.ndarray:
+    """Vectorized version of pd_timestamp_to_seconds for a pandas.Series (or
+    array-like) of timestamps. Datetime, period and numeric dtypes are
+    converted with a single numpy cast rather than per-element dispatch.
+
+    NOTE: Like pd.Timestamp.timestamp(), datetime values are rounded to
+        microsecond precision so that both functions agree.
+
+    Returns:
+        np.ndarray: float64 seconds-since-epoch for each timestamp
+    """
+    series = timestamps if isinstance(timestamps, pd.Series) else pd.Series(timestamps)
+
+    if isinstance(series.dtype, pd.PeriodDtype):
+        series = series.dt.to_timestamp()  # no utc shift
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is not None:
+            series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        values = series.to_numpy(dtype="datetime64[ns]")
+        seconds = np.round(values.view("int64") / 1e9, 6)
+        seconds[np.isnat(values)] = np.nan
+        return seconds
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=np.float64)
+
+    # mixed/object sequences fall back to scalar dispatch
+    return np.array([pd_timestamp_to_seconds(ts) for ts in series], dtype=np.float64)
+
+
 def strip_periodic(
     input_df: pd.DataFrame, ts_col_name: Union[str, None] = None, create_copy=True
 ) -> pd.DataFrame:
@@ -89,13 +131,12 @@ def strip_periodic(
     except ValueError:
         index = -1
 
-    df = input_df
-    if index >= 0:
-        df = input_df if not create_copy else input_df.copy(deep=False)
-        # df.iloc[:, index]
-        df[df.columns[index]] = [
-            x.to_timestamp() if hasattr(x, "to_timestamp") else x
-            for x in df.iloc[:, index]
-        ]
+    if index < 0 or not isinstance(input_df.iloc[:, index].dtype, pd.PeriodDtype):
+        return input_df
+
+    # NOTE: a shallow copy is used rather than DataFrame.assign, which
+    #   deep-copies every column without copy-on-write
+    df = input_df if not create_copy else input_df.copy(deep=False)
+    df[df.columns[index]] = df.iloc[:, index].dt.to_timestamp()
 
     return df
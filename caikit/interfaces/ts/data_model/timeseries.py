@@ -116,7 +116,7 @@ class TimeSeries(DataObjectBase):
         if isinstance(backend, PandasMultiTimeSeriesBackend):
             return len(backend._df)
         if HAVE_PYSPARK and isinstance(self._backend, SparkMultiTimeSeriesBackend):
-            return backend._pyspark_df.count()
+            return len(backend)
 
         error.log_raise(
             "<COR75394521E>",
@@ -180,6 +180,7 @@ class TimeSeries(DataObjectBase):
 
         key_columns = self.id_labels
         dfs = []
+        ids = []
         value_columns = None
         timestamp_column = None
         for ts in self.timeseries:  # pylint: disable=not-an-iterable
@@ -187,14 +188,18 @@ class TimeSeries(DataObjectBase):
                 value_columns = ts.value_labels
                 if ts.timestamp_label != "":
                     timestamp_column = ts.timestamp_label
-            df = ts._get_pd_df()[0]
-
-            for i, key_col in enumerate(key_columns):
-                id_val = ts.ids.values[i]
-                df[key_col] = [id_val] * df.shape[0]
-            dfs.append(df)
+            dfs.append(ts._get_pd_df()[0])
+            if key_columns:
+                ids.append(ts.ids.values)
         ignore_index = True  # timestamp_column != ""
-        result = pd.concat(dfs, ignore_index=ignore_index)
+        result = pd.concat(dfs, ignore_index=ignore_index, copy=False)
+
+        # the ids are constant per timeseries, so each key column is filled in
+        # a single pass over the concatenated frame rather than per timeseries
+        lengths = [df.shape[0] for df in dfs]
+        for i, key_col in enumerate(key_columns):
+            result[key_col] = np.repeat([id_vals[i] for id_vals in ids], lengths)
+
         self._backend = PandasMultiTimeSeriesBackend(
             result,
             key_column=key_columns,
@@ -242,7 +247,9 @@ class TimeSeries(DataObjectBase):
 
             # add a RESERVED id column with constant value
             if is_multi is not None and is_multi:
-                df = df.copy(deep=True)
+                # a shallow copy is enough to add a column without mutating
+                # the source frame (assign deep copies under pandas<2)
+                df = df.copy(deep=False)
                 df[self.__class__._DEFAULT_ID_COL] = np.zeros(len(df), dtype=np.int32)
             return df
 
@@ -254,10 +261,9 @@ class TimeSeries(DataObjectBase):
         if include_timestamps and timestamp_column is None:
             backend_df = backend_df.copy()  # avoid mutating original
             ts_column = self.__class__._DEFAULT_TS_COL
-            backend_df[ts_column] = [0] * len(backend_df)
             backend_df[ts_column] = backend_df.groupby(
                 self._backend._key_column, sort=False
-            )[ts_column].transform(lambda x: list(range(len(x))))
+            ).cumcount()
             return backend_df
         # if we do not want timestamps, but we already have them in the dataframe, we need to
         # return a view without timestamps
@@ -290,41 +296,55 @@ class TimeSeries(DataObjectBase):
         if not HAVE_PYSPARK:
             raise NotImplementedError("pyspark must be available to use this method.")
 
-        # todo: is this right???
-        if len(self.id_labels) == 0:
-            # pylint: disable=unsubscriptable-object
-            df = self.timeseries[0].as_spark(include_timestamps=include_timestamps)
-            # add a RESERVED id column with constant value
-            if is_multi is not None and is_multi:
-                df = df.pandas_api()
-                df = df.copy(deep=True)
-                df[self.__class__._DEFAULT_ID_COL] = np.zeros(
-                    len(df), dtype=np.int32
-                ).tolist()
-                df = df.to_spark()
-            return df
-
         # Third Party
         # pylint: disable=import-outside-toplevel
-        from pyspark.sql import SparkSession
+        from pyspark.sql import SparkSession, Window
+        from pyspark.sql.functions import col, lit, row_number
 
         # Local
         # pylint: disable=import-outside-toplevel
         from ..data_model.backends._spark_backends import SparkMultiTimeSeriesBackend
 
-        # If there is a backend that knows how to do the conversion, use that
         backend = getattr(self, "_backend", None)
-        if backend is not None and isinstance(backend, SparkMultiTimeSeriesBackend):
+
+        # todo: is this right???
+        if len(self.id_labels) == 0:
+            if isinstance(backend, SparkMultiTimeSeriesBackend) and not (
+                include_timestamps and backend._timestamp_column is None
+            ):
+                # the spark frame already is the answer, so skip building the
+                # single timeseries and its pandas api round trip
+                df = backend._pyspark_df
+                if (
+                    include_timestamps is not None
+                    and not include_timestamps
+                    and backend._timestamp_column is not None
+                ):
+                    df = df.drop(backend._timestamp_column)
+            else:
+                # pylint: disable=unsubscriptable-object
+                df = self.timeseries[0].as_spark(include_timestamps=include_timestamps)
+            # add a RESERVED id column with constant value
+            if is_multi is not None and is_multi:
+                # a constant column keeps this a lazy, distributed projection
+                df = df.withColumn(self.__class__._DEFAULT_ID_COL, lit(0).cast("long"))
+            return df
+
+        # If there is a backend that knows how to do the conversion, use that
+        if isinstance(backend, SparkMultiTimeSeriesBackend):
             answer = backend._pyspark_df
             timestamp_column = backend._timestamp_column
             if include_timestamps and timestamp_column is None:
 
                 def append_timestamp_column(aspark_df, key_cols, timestamp_name):
-                    sql = (
-                        f"row_number() OVER (PARTITION BY {','.join(key_cols)} "
-                        f"ORDER BY {','.join(key_cols)}) -1 as {timestamp_name}"
+                    # typed columns rather than interpolated sql so that any
+                    # column name works; row_number requires an ordering and
+                    # a constant one avoids sorting within each key
+                    window = Window.partitionBy(*[col(c) for c in key_cols])
+                    window = window.orderBy(lit(1))
+                    return aspark_df.withColumn(
+                        timestamp_name, row_number().over(window) - 1
                     )
-                    return aspark_df.selectExpr("*", sql)
 
                 answer = append_timestamp_column(
                     answer, key_cols=self.id_labels, timestamp_name="timestamp"
@@ -439,6 +439,7 @@ def test_create_single_timeseries_dm():
     spark_mts = mts.as_spark(is_multi=True)
     assert isinstance(spark_mts, pyspark.sql.DataFrame)
     assert reserved_key in spark_mts.columns
+    assert [r[reserved_key] for r in spark_mts.collect()] == [0, 0, 0]
 
     spark_ts = mts.as_spark()
     assert reserved_key not in spark_ts.columns
@@ -446,6 +447,8 @@ def test_create_single_timeseries_dm():
     pandas_mts = mts.as_pandas(is_multi=True)
     assert isinstance(pandas_mts, pd.DataFrame)
     assert reserved_key in pandas_mts.columns
+    assert pandas_mts[reserved_key].tolist() == [0, 0, 0]
+    assert reserved_key not in df.columns
 
     pandas_ts = mts.as_pandas()
     assert reserved_key not in pandas_ts.columns
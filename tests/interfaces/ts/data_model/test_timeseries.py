@@ -36,10 +36,17 @@ import pytest
 from caikit.core.data_model import ProducerId
 from caikit.interfaces.ts.data_model import SingleTimeSeries
 from caikit.interfaces.ts.data_model.backends._spark_backends import ensure_spark_cached
-from caikit.interfaces.ts.data_model.backends.spark_util import iteritems_workaround
+from caikit.interfaces.ts.data_model.backends.dfcache import ensure_spark_grouped
+from caikit.interfaces.ts.data_model.backends.spark_util import (
+    arrow_enabled,
+    iteritems_workaround,
+    mock_pd_groupby,
+)
 from caikit.interfaces.ts.data_model.backends.util import (
     pd_timestamp_to_seconds,
+    pd_timestamp_to_seconds_array,
     strip_periodic,
+    timezoneoffset,
 )
 from tests.interfaces.ts.data_model.util import create_extended_test_dfs, df_project
 from tests.interfaces.ts.helpers import sslocal_fixture, test_log
@@ -637,6 +644,58 @@ def test_pd_timestamp_to_seconds():
         pd_timestamp_to_seconds([])
 
 
+def test_pd_timestamp_to_seconds_array():
+    for timestamps in [
+        pd.Series(pd.date_range("2000", freq="37min", periods=5)),
+        pd.Series(pd.date_range("2000", freq="D", periods=5, tz="US/Eastern")),
+        pd.Series(pd.period_range("2000", freq="B", periods=5)),
+        pd.Series([1, 2, 3], dtype=np.int32),
+        pd.Series([1.5, 2.5, 3.5]),
+        pd.Series([datetime(2000, 1, 1, tzinfo=timezone.utc), 12.0], dtype=object),
+    ]:
+        seconds = pd_timestamp_to_seconds_array(timestamps)
+        assert seconds.dtype == np.float64
+        assert seconds.tolist() == [pd_timestamp_to_seconds(x) for x in timestamps]
+
+    assert pd_timestamp_to_seconds_array(
+        pd.date_range("2000", freq="D", periods=2)
+    ).tolist() == [946684800.0, 946771200.0]
+    with pytest.raises(ValueError):
+        pd_timestamp_to_seconds_array(pd.Series(["foo"]))
+
+
+def test_strip_periodic():
+    df = pd.DataFrame(
+        {"ts": pd.period_range("2000", freq="D", periods=3), "val": [1, 2, 3]}
+    )
+    stripped = strip_periodic(df, create_copy=True)
+    assert stripped is not df
+    assert isinstance(df["ts"].dtype, pd.PeriodDtype)
+    assert stripped["ts"].tolist() == [p.to_timestamp() for p in df["ts"]]
+    assert pd.api.types.is_datetime64_dtype(stripped["ts"])
+
+    # no periodic column found is a no-op
+    assert strip_periodic(stripped) is stripped
+    assert strip_periodic(df, ts_col_name="val") is df
+
+    assert strip_periodic(df, create_copy=False) is df
+    assert pd.api.types.is_datetime64_dtype(df["ts"])
+
+
+def test_timezoneoffset():
+    def expected(adatetime):
+        return adatetime.timestamp() - adatetime.replace(tzinfo=None).timestamp()
+
+    start = datetime(2021, 3, 1, tzinfo=timezone.utc)
+    for tz in [timezone.utc, timezone(dt.timedelta(hours=-5, minutes=-30)), None]:
+        for minutes in range(0, 60 * 24 * 300, 617):
+            adatetime = (
+                start + dt.timedelta(minutes=minutes, seconds=7, microseconds=11)
+            ).replace(tzinfo=tz)
+            assert timezoneoffset(adatetime) == expected(adatetime)
+    assert timezoneoffset(datetime(2021, 3, 1)) == 0
+
+
 @pytest.fixture(scope="module")
 def trivial_pandas_df():
     return pd.DataFrame(columns=["a", "b", "c"], data=[[1, 2, 3], [1, 4, 5]])
@@ -693,6 +752,45 @@ def test_as_spark_with_str_key_cols(trivial_spark_df):
     assert (p1.to_numpy() == p2.to_numpy()).all()
 
 
+def test_as_spark_timestamps_with_special_key_cols(sslocal_fixture):
+    df = sslocal_fixture.createDataFrame(
+        pd.DataFrame({"key id": ["a", "a", "b"], "val": [1, 2, 3]})
+    )
+    ts = dm.TimeSeries(df, key_column=["key id"])
+    pdf = ts.as_spark(include_timestamps=True).toPandas()
+    assert sorted(pdf["timestamp"].tolist()) == [0, 0, 1]
+    for _, group in pdf.groupby("key id"):
+        assert sorted(group["timestamp"].tolist()) == list(range(len(group)))
+
+
+@pytest.mark.filterwarnings(
+    "ignore:If `index_col` is not specified for `to_spark`, the existing index is lost when converting to Spark DataFrame.*:pyspark.pandas.utils.PandasAPIOnSparkAdviceWarning",
+)
+def test_as_spark_keyless_spark_backend(trivial_spark_df):
+    ts = dm.TimeSeries(trivial_spark_df, timestamp_column="a")
+    reserved_key = dm.TimeSeries._DEFAULT_ID_COL
+
+    assert ts.as_spark() is trivial_spark_df
+    pdf = ts.as_spark(include_timestamps=False, is_multi=True).toPandas()
+    assert pdf.columns.tolist() == ["b", "c", reserved_key]
+    assert pdf["b"].tolist() == [2, 4]
+    assert pdf[reserved_key].tolist() == [0, 0]
+
+    # generated timestamps still go through the single timeseries
+    ts = dm.TimeSeries(trivial_spark_df.select("b", "c"))
+    pdf = ts.as_spark(include_timestamps=True, is_multi=True).toPandas()
+    assert pdf["timestamp"].tolist() == [0, 1]
+    assert pdf[reserved_key].tolist() == [0, 0]
+
+
+def test_spark_mts_value_columns_exclude_exact_keys(sslocal_fixture):
+    df = sslocal_fixture.createDataFrame(
+        pd.DataFrame({"ab": [1, 1, 2], "a": [1.0, 2.0, 3.0], "t": [0, 1, 0]})
+    )
+    ts = dm.TimeSeries(df, key_column="ab", timestamp_column="t")
+    assert ts._backend._value_columns == ["a"]
+
+
 def test_as_spark_with_producer_id(trivial_spark_df):
     df = trivial_spark_df
     ts = dm.TimeSeries(
@@ -705,6 +803,162 @@ def test_as_spark_with_producer_id(trivial_spark_df):
     assert ts.producer_id.version == "1.2.3"
 
 
+def test_mock_pd_groupby_non_string_keys(sslocal_fixture):
+    """Keys that do not survive string formatting (quotes, ints, nulls) must
+    still select their own groups"""
+    df = sslocal_fixture.createDataFrame(
+        pd.DataFrame(
+            {
+                "key_str": ["it's", "it's", "plain", None],
+                "key_int": [1, 1, 2, 3],
+                "val": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+    )
+    groups = {k: sub_df.toPandas() for k, sub_df in mock_pd_groupby(df, by=["key_str"])}
+    assert sorted(len(g) for g in groups.values()) == [1, 1, 2]
+    assert groups["it's"]["val"].tolist() == [1.0, 2.0]
+    assert groups[None]["val"].tolist() == [4.0]
+
+    groups = {
+        k: sub_df.toPandas()
+        for k, sub_df in mock_pd_groupby(df, by=["key_str", "key_int"])
+    }
+    assert groups[("it's", 1)]["val"].tolist() == [1.0, 2.0]
+    assert groups[("plain", 2)]["val"].tolist() == [3.0]
+
+
+def test_ensure_spark_cached_persists_memory_and_disk(trivial_spark_df):
+    df = trivial_spark_df.select("a", "b")
+    assert not df.is_cached
+    with ensure_spark_cached(df) as cached_df:
+        assert cached_df.is_cached
+        assert cached_df.storageLevel == pyspark.StorageLevel.MEMORY_AND_DISK
+    assert not df.is_cached
+
+
+def test_spark_metadata_access_runs_no_jobs(trivial_spark_df):
+    spark_context = trivial_spark_df.sparkSession.sparkContext
+    group_id = "test_spark_metadata_access_runs_no_jobs"
+    ts = dm.TimeSeries(trivial_spark_df, timestamp_column="a")
+    spark_context.setJobGroup(group_id, group_id)
+    try:
+        single_ts = ts.timeseries[0]
+        assert single_ts.timestamp_label == "a"
+        assert single_ts.value_labels == ["b", "c"]
+        assert not spark_context.statusTracker().getJobIdsForGroup(group_id)
+    finally:
+        spark_context.setLocalProperty("spark.jobGroup.id", None)
+        spark_context.setLocalProperty("spark.job.description", None)
+
+
+def test_ensure_spark_grouped(sslocal_fixture):
+    df = sslocal_fixture.createDataFrame(
+        pd.DataFrame({"key": [3, 1, 2, 1, 3, 2, 1], "val": list(range(7))})
+    )
+    with ensure_spark_grouped(df, ["key"]) as grouped_df:
+        assert grouped_df.is_cached
+        assert not df.is_cached
+        assert sorted(grouped_df.collect()) == sorted(df.collect())
+        partitions = [
+            [row.key for row in part]
+            for part in grouped_df.rdd.glom().collect()
+            if part
+        ]
+        for keys in partitions:
+            assert keys == sorted(keys)
+        all_keys = [k for keys in partitions for k in set(keys)]
+        assert len(all_keys) == len(set(all_keys))
+    assert not grouped_df.is_cached
+
+
+def test_arrow_enabled_restores_conf(sslocal_fixture):
+    key = "spark.sql.execution.arrow.pyspark.fallback.enabled"
+    fallback = sslocal_fixture.conf.get(key, None)
+    sslocal_fixture.conf.set("spark.sql.execution.arrow.pyspark.enabled", "false")
+    try:
+        with arrow_enabled(sslocal_fixture) as spark:
+            assert spark.conf.get("spark.sql.execution.arrow.pyspark.enabled") == "true"
+            assert spark.conf.get(key) == "true"
+        assert (
+            sslocal_fixture.conf.get("spark.sql.execution.arrow.pyspark.enabled")
+            == "false"
+        )
+        assert sslocal_fixture.conf.get(key, None) == fallback
+    finally:
+        sslocal_fixture.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
+
+
+@pytest.mark.filterwarnings(
+    "ignore:.*loads all data into the driver's memory.*:pyspark.pandas.utils.PandasAPIOnSparkAdviceWarning",
+)
+def test_spark_mts_lazy_timeseries(sslocal_fixture):
+    # Local
+    from caikit.interfaces.ts.data_model.backends._spark_backends import (
+        SparkTimeSeriesBackend,
+    )
+    from caikit.interfaces.ts.data_model.backends.pandas_backends import (
+        PandasTimeSeriesBackend,
+    )
+
+    df = pd.DataFrame(
+        [(x, "A" if x < 3 else "B", x * 5) for x in range(5)],
+        columns=["ts", "key", "val"],
+    )
+    spark_df = sslocal_fixture.createDataFrame(df)
+
+    collected = dm.TimeSeries(spark_df, key_column="key", timestamp_column="ts")
+    lazy = dm.TimeSeries(
+        spark_df, key_column="key", timestamp_column="ts", lazy_timeseries=True
+    )
+    assert all(
+        isinstance(ts._backend, PandasTimeSeriesBackend) for ts in collected.timeseries
+    )
+    assert all(
+        isinstance(ts._backend, SparkTimeSeriesBackend) for ts in lazy.timeseries
+    )
+    # the lazy backends reuse the pandas logic without a placeholder frame
+    assert all(ts._backend._pdbackend_helper._df is None for ts in lazy.timeseries)
+    # spark does not guarantee the order of the lazy groups
+    assert sorted(ts.to_json() for ts in collected.timeseries) == sorted(
+        ts.to_json() for ts in lazy.timeseries
+    )
+    assert collected == dm.TimeSeries(df, key_column="key", timestamp_column="ts")
+
+    # null keys are kept as their own group by both
+    df["key"] = ["A", "A", None, "B", None]
+    spark_df = sslocal_fixture.createDataFrame(df)
+    collected, lazy = [
+        dm.TimeSeries(
+            spark_df, key_column="key", timestamp_column="ts", lazy_timeseries=lazy
+        ).timeseries
+        for lazy in [False, True]
+    ]
+    assert len(collected) == 3
+    assert sorted(ts.to_json() for ts in collected) == sorted(
+        ts.to_json() for ts in lazy
+    )
+
+    # composite keys mixing str and int
+    df["key"] = ["A", "A", "B", "B", "B"]
+    df["key2"] = [1, 1, 1, 2, 2]
+    spark_df = sslocal_fixture.createDataFrame(df)
+    collected, lazy = [
+        dm.TimeSeries(
+            spark_df,
+            key_column=["key", "key2"],
+            timestamp_column="ts",
+            lazy_timeseries=lazy,
+        )
+        for lazy in [False, True]
+    ]
+    assert len(collected.timeseries) == 3
+    assert sorted(ts.to_json() for ts in collected.timeseries) == sorted(
+        ts.to_json() for ts in lazy.timeseries
+    )
+    assert json.loads(collected.to_json())["id_labels"] == ["key", "key2"]
+
+
 def test_mts_len(sslocal_fixture):
     df = pd.concat(
         [
@@ -726,6 +980,9 @@ def test_mts_len(sslocal_fixture):
         key_column="key",
     )
 
+    assert len(mts) == 40
+    # the count is memoized on the backend
+    assert mts._backend._cached_count == 40
     assert len(mts) == 40
 
     # pandas
@@ -746,6 +1003,62 @@ def test_mts_len(sslocal_fixture):
     assert len(mts) == 40
 
 
+def test_arrow_enabled_overlapping_blocks(sslocal_fixture):
+    """Overlapping blocks (as from concurrent threads) that exit out of order
+    must not restore each other's forced values"""
+    key = "spark.sql.execution.arrow.pyspark.enabled"
+    sslocal_fixture.conf.set(key, "false")
+    try:
+        first, second = arrow_enabled(sslocal_fixture), arrow_enabled(sslocal_fixture)
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        assert sslocal_fixture.conf.get(key) == "true"
+        second.__exit__(None, None, None)
+        assert sslocal_fixture.conf.get(key) == "false"
+    finally:
+        sslocal_fixture.conf.set(key, "true")
+
+
+@pytest.mark.filterwarnings(
+    "ignore:.*loads all data into the driver's memory.*:pyspark.pandas.utils.PandasAPIOnSparkAdviceWarning",
+)
+def test_spark_vectors_collect_without_forcing_arrow(sslocal_fixture):
+    # Third Party
+    from pyspark.ml.linalg import Vectors, VectorUDT
+    from pyspark.sql.types import LongType, StringType, StructField, StructType
+
+    schema = StructType(
+        [
+            StructField("ts", LongType(), True),
+            StructField("id", StringType(), True),
+            StructField("value", VectorUDT(), True),
+        ]
+    )
+    df = sslocal_fixture.createDataFrame(
+        data=[(0, "id", Vectors.dense([1.0, 2.0]))], schema=schema
+    )
+
+    arrow_key = "spark.sql.execution.arrow.pyspark.enabled"
+    sslocal_fixture.conf.set(arrow_key, "false")
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for lazy in [False, True]:
+                mts = dm.TimeSeries(
+                    df,
+                    key_column="id",
+                    timestamp_column="ts",
+                    value_columns=["value"],
+                    lazy_timeseries=lazy,
+                )
+                mts.as_pandas()
+                mts.to_json()
+        assert not [w for w in caught if "Arrow optimization" in str(w.message)]
+    finally:
+        sslocal_fixture.conf.set(arrow_key, "true")
+
+
 @pytest.mark.filterwarnings(
     "ignore:.*loads all data into the driver's memory.*:pyspark.pandas.utils.PandasAPIOnSparkAdviceWarning",
     "ignore:toPandas attempted Arrow optimization.*:UserWarning",